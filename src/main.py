@@ -11,9 +11,10 @@ import sys
 import pandas as pd
 import argparse
 from modules.config import DATA_PATH, DEFAULT_TIME_RANGE
-from modules.data_preparation import load_data, prepare_data
+from modules.data_preparation import load_prepared_data
 from modules.data_validation import validate_dataframe, get_data_summary
 from modules.visualization import (
+    aggregate_totals,
     plot_total_animals_slaughtered,
     plot_most_slaughtered_animals,
     plot_animals_by_region,
@@ -68,10 +69,9 @@ def main():
     
     print(f"Loading data from {args.data_path}...")
     try:
-        # Load and prepare data
-        raw_data = load_data(args.data_path)
-        print("Preparing data...")
-        data = prepare_data(raw_data)
+        # Load and prepare data (served from the Parquet cache when the
+        # source CSV is unchanged)
+        data = load_prepared_data(args.data_path)
         
         # Validate data
         print("Validating data...")
@@ -108,33 +108,30 @@ def main():
         # Set time range for analysis
         time_range = (args.start_year, args.end_year)
         print(f"\nGenerating plots for time range: {time_range[0]} to {time_range[1]}...")
-        
-        # Generate and save plots
-        print("1. Generating total animals slaughtered plot...")
-        fig1 = plot_total_animals_slaughtered(data, time_range)
-        fig1.write_html(os.path.join(args.output_dir, "total_animals_slaughtered.html"))
-        fig1.write_image(os.path.join(args.output_dir, "total_animals_slaughtered.png"))
-        
-        print("2. Generating most slaughtered animals plot...")
-        fig2 = plot_most_slaughtered_animals(data, time_range)
-        fig2.write_html(os.path.join(args.output_dir, "most_slaughtered_animals.html"))
-        fig2.write_image(os.path.join(args.output_dir, "most_slaughtered_animals.png"))
-        
-        print("3. Generating animals by region plot...")
-        fig3 = plot_animals_by_region(data, time_range)
-        fig3.write_html(os.path.join(args.output_dir, "animals_by_region.html"))
-        fig3.write_image(os.path.join(args.output_dir, "animals_by_region.png"))
-        
-        print("4. Generating seasonal fluctuations plot...")
-        fig4 = plot_seasonal_fluctuations(data, time_range)
-        fig4.write_html(os.path.join(args.output_dir, "seasonal_fluctuations.html"))
-        fig4.write_image(os.path.join(args.output_dir, "seasonal_fluctuations.png"))
-        
-        print("5. Generating slaughter distribution plot...")
-        fig5 = plot_slaughter_distribution(data, time_range)
-        fig5.write_html(os.path.join(args.output_dir, "slaughter_distribution.html"))
-        fig5.write_image(os.path.join(args.output_dir, "slaughter_distribution.png"))
-        
+
+        # Precompute the shared aggregates once for all plots
+        aggregates = aggregate_totals(data, time_range)
+
+        # Generate each figure and stream it to disk immediately instead of
+        # keeping all five figures alive at once
+        plots = [
+            ("total animals slaughtered", "total_animals_slaughtered",
+             plot_total_animals_slaughtered),
+            ("most slaughtered animals", "most_slaughtered_animals",
+             plot_most_slaughtered_animals),
+            ("animals by region", "animals_by_region",
+             plot_animals_by_region),
+            ("seasonal fluctuations", "seasonal_fluctuations",
+             plot_seasonal_fluctuations),
+            ("slaughter distribution", "slaughter_distribution",
+             plot_slaughter_distribution),
+        ]
+        for index, (label, file_stem, plot_function) in enumerate(plots, start=1):
+            print(f"{index}. Generating {label} plot...")
+            fig = plot_function(data, time_range, aggregates=aggregates)
+            fig.write_html(os.path.join(args.output_dir, f"{file_stem}.html"))
+            fig.write_image(os.path.join(args.output_dir, f"{file_stem}.png"))
+
         print(f"\nAnalysis completed. Results saved to {args.output_dir}/")
         
     except Exception as e:
@@ -5,10 +5,40 @@ This module provides functions for loading, cleaning, and transforming
 the German animal slaughter dataset.
 """
 
+import os
+
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Optional, Union
-from .config import ANIMAL_SPECIES
+from .config import ANIMAL_SPECIES, MONTHS_ORDER
+
+# Directory for cached prepared datasets (see load_prepared_data)
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "animal_slaughter_analysis")
+
+# Mapping from the raw CSV column suffixes (pandas appends '.1', '.2', ...
+# to duplicated headers) to the standardized column name suffixes
+SUFFIX_MAP = {
+    '': '_DoNr',
+    '.1': '_DoT',
+    '.2': '_FoNr',
+    '.3': '_FoT',
+    '.4': '_HoNr',
+    '.5': '_HoT'
+}
+
+# Column groups derived once at import so the hot paths index directly
+# instead of rebuilding lists or matching column names per call
+SPECIES_COLUMNS = [
+    f"{species}{suffix}"
+    for species in ANIMAL_SPECIES
+    for suffix in SUFFIX_MAP.values()
+]
+DONR_COLUMNS = [f"{species}_DoNr" for species in ANIMAL_SPECIES]
+FONR_COLUMNS = [f"{species}_FoNr" for species in ANIMAL_SPECIES]
+HONR_COLUMNS = [f"{species}_HoNr" for species in ANIMAL_SPECIES]
+DOT_COLUMNS = [f"{species}_DoT" for species in ANIMAL_SPECIES]
+FOT_COLUMNS = [f"{species}_FoT" for species in ANIMAL_SPECIES]
+HOT_COLUMNS = [f"{species}_HoT" for species in ANIMAL_SPECIES]
 
 
 def load_data(file_path: str) -> pd.DataFrame:
@@ -28,18 +58,25 @@ def load_data(file_path: str) -> pd.DataFrame:
     Notes:
     ------
     The CSV file is expected to have a specific format with header rows.
-    The first 4 rows contain metadata and are skipped during loading.
-    The function handles encoding issues with Latin-1 encoding.
+    The first 4 rows contain metadata and are skipped during loading; the
+    last 4 rows contain footer metadata and are sliced off after parsing.
+    The file is decoded as UTF-8; umlauts lost upstream appear as the
+    Unicode replacement character and are repaired in prepare_data.
     """
     try:
+        # The C parser does not support skipfooter, so read everything and
+        # slice the 4 footer rows off afterwards; it is several times faster
+        # than the Python engine and converts the '-'/'x' placeholders to
+        # NaN during parsing
         data = pd.read_csv(
             file_path,
             header=4,
             sep=";",
-            encoding="latin1",
-            skipfooter=4,
-            engine="python"
+            encoding="utf-8",
+            na_values=['-', 'x'],
+            engine="c"
         )
+        data = data.iloc[:-4]
         return data
     except Exception as e:
         print(f"Error loading data from {file_path}: {str(e)}")
@@ -68,16 +105,15 @@ def rename_columns(data: pd.DataFrame) -> pd.DataFrame:
         - {species}_HoNr: Home slaughter, animal count
         - {species}_HoT: Home slaughter, quantity in tons
     """
-    for species in ANIMAL_SPECIES:
-        data = data.rename(columns={
-            species: species + '_' + 'DoNr',
-            species + ".1": species + '_' + 'DoT',
-            species + ".2": species + '_' + 'FoNr',
-            species + ".3": species + '_' + 'FoT',
-            species + ".4": species + '_' + 'HoNr',
-            species + ".5": species + '_' + 'HoT'
-        })
-    
+    # Build the full mapping once and rename in a single pass instead of
+    # rebuilding the column index once per species
+    mapping = {
+        f"{species}{old_suffix}": f"{species}{new_suffix}"
+        for species in ANIMAL_SPECIES
+        for old_suffix, new_suffix in SUFFIX_MAP.items()
+    }
+    data.rename(columns=mapping, inplace=True)
+
     return data
 
 
@@ -102,16 +138,75 @@ def calculate_totals(data: pd.DataFrame) -> pd.DataFrame:
         - Total Foreign(t): Total weight of foreign slaughtered animals in tons
         - Total Home(t): Total weight of home slaughtered animals in tons
     """
-    # Calculate totals for animal counts (Nr)
-    data['Total Domestic(Nr)'] = data.filter(regex='_DoNr').apply(pd.to_numeric, errors='coerce').sum(axis=1)
-    data['Total Foreign(Nr)'] = data.filter(regex='_FoNr').apply(pd.to_numeric, errors='coerce').sum(axis=1)
-    data['Total Home(Nr)'] = data.filter(regex='_HoNr').apply(pd.to_numeric, errors='coerce').sum(axis=1)
-    
-    # Calculate totals for weights (t)
-    data['Total Domestic(t)'] = data.filter(regex='_DoT').apply(pd.to_numeric, errors='coerce').sum(axis=1)
-    data['Total Foreign(t)'] = data.filter(regex='_FoT').apply(pd.to_numeric, errors='coerce').sum(axis=1)
-    data['Total Home(t)'] = data.filter(regex='_HoT').apply(pd.to_numeric, errors='coerce').sum(axis=1)
-    
+    # Convert all species columns to numeric in a single pass so each total
+    # below can sum an already-numeric block instead of re-coercing
+    data[SPECIES_COLUMNS] = data[SPECIES_COLUMNS].apply(pd.to_numeric, errors='coerce')
+
+    # Stack the species columns into one contiguous (rows, species, channel)
+    # float64 array and reduce over the species axis in a single pass instead
+    # of six separate pandas column reductions
+    values = data[SPECIES_COLUMNS].to_numpy(dtype=np.float64)
+    values = values.reshape(len(data), len(ANIMAL_SPECIES), len(SUFFIX_MAP))
+    totals = np.nansum(values, axis=1)
+
+    # Channel order follows SUFFIX_MAP: DoNr, DoT, FoNr, FoT, HoNr, HoT
+    data['Total Domestic(Nr)'] = totals[:, 0]
+    data['Total Foreign(Nr)'] = totals[:, 2]
+    data['Total Home(Nr)'] = totals[:, 4]
+    data['Total Domestic(t)'] = totals[:, 1]
+    data['Total Foreign(t)'] = totals[:, 3]
+    data['Total Home(t)'] = totals[:, 5]
+
+    return _downcast_slaughter_columns(data)
+
+
+def _downcast_slaughter_columns(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcasts the species and total columns to halve their memory footprint.
+
+    Animal counts fit comfortably in 32-bit integers (nullable Int32 keeps
+    the NaN placeholders) and tonnages in float32; the narrower dtypes halve
+    the bytes moved by every downstream aggregation.
+    """
+    nr_columns = DONR_COLUMNS + FONR_COLUMNS + HONR_COLUMNS + [
+        'Total Domestic(Nr)', 'Total Foreign(Nr)', 'Total Home(Nr)'
+    ]
+    t_columns = DOT_COLUMNS + FOT_COLUMNS + HOT_COLUMNS + [
+        'Total Domestic(t)', 'Total Foreign(t)', 'Total Home(t)'
+    ]
+
+    data[nr_columns] = data[nr_columns].astype('Int32')
+    data[t_columns] = data[t_columns].astype('float32')
+    return data
+
+
+def downcast_numerics(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Downcasts plain int64/float64 columns to the narrowest dtype that fits.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        The DataFrame whose numeric columns should be narrowed
+
+    Returns:
+    --------
+    pd.DataFrame
+        The same DataFrame with narrowed numeric columns
+
+    Notes:
+    ------
+    _downcast_slaughter_columns handles the known species and total
+    columns; this generic pass covers everything else that parses as
+    64-bit by default (e.g. Year), since every downstream groupby, sum,
+    and hash is memory-bound and narrower columns move fewer bytes.
+    """
+    for column in data.columns:
+        dtype = data[column].dtype
+        if dtype == np.int64:
+            data[column] = pd.to_numeric(data[column], downcast='integer')
+        elif dtype == np.float64:
+            data[column] = pd.to_numeric(data[column], downcast='float')
     return data
 
 
@@ -133,36 +228,228 @@ def prepare_data(data: pd.DataFrame) -> pd.DataFrame:
     ------
     This function performs the following operations:
     1. Renames unnamed columns to 'State', 'Year', and 'Month'
-    2. Adjusts the DataFrame index
-    3. Drops rows with NaN values in key columns
+    2. Drops rows with NaN values in key columns
+    3. Resets the index to a fresh RangeIndex
     4. Converts the 'Year' column to integer type
     5. Fixes encoding issues in the 'State' column
     6. Renames animal species columns using a standardized convention
-    7. Replaces special characters ('-', 'x') with NaN values
-    8. Calculates total columns for domestic, foreign, and home slaughter data
+    7. Converts 'State' to a categorical and 'Month' to an ordered categorical
+    8. Calculates total columns for domestic, foreign, and home slaughter data;
+       special characters ('-', 'x') become NaN during the numeric conversion
+    9. Stable-sorts the rows by Year so year-range filters can slice via
+       binary search
+    10. Downcasts any remaining 64-bit numeric columns to the narrowest
+        dtype that fits
     """
-    # Rename unnamed columns
-    data = data.rename(columns={'Unnamed: 0': 'State', 'Unnamed: 1': 'Year', 'Unnamed: 2': 'Month'})
-    
-    # Adjust index (to account for header rows)
-    data = data.set_index(data.index - 3)
-    
-    # Drop rows with NaN values in key columns
-    data = data.dropna(subset=['State', 'Year', 'Month'])
-    
+    # Rename unnamed columns; inplace avoids rematerializing the frame for
+    # a metadata-only change
+    data.rename(columns={'Unnamed: 0': 'State', 'Unnamed: 1': 'Year', 'Unnamed: 2': 'Month'}, inplace=True)
+
+    # Drop rows with NaN values in key columns, then start from a fresh
+    # RangeIndex (the old offset arithmetic materialized a full integer
+    # index just to account for the skipped header rows)
+    data.dropna(subset=['State', 'Year', 'Month'], inplace=True)
+    data.reset_index(drop=True, inplace=True)
+
     # Convert Year to integer
     data["Year"] = data["Year"].astype(int)
     
-    # Fix encoding issues
-    data['State'] = data['State'].str.replace("ï¿½", "ü")
-    
     # Rename columns using standardized convention
     data = rename_columns(data)
-    
-    # Replace special characters with NaN
-    data = data.replace({'-': pd.NA, 'x': pd.NA})
-    
-    # Calculate totals
+
+    # Convert the low-cardinality key columns to categoricals so groupbys
+    # hash small integer codes instead of Python strings; Month is ordered
+    # so seasonal aggregations come out in calendar order
+    data['State'] = data['State'].astype('category')
+
+    # Fix encoding issues: the source file lost its umlauts to the Unicode
+    # replacement character, so repair them on the 16 category labels
+    # instead of scanning every row
+    data['State'] = data['State'].cat.rename_categories(
+        lambda state: state.replace('�', 'ü')
+    )
+    data['Month'] = pd.Categorical(data['Month'], categories=MONTHS_ORDER, ordered=True)
+
+    # Calculate totals; the numeric coercion inside turns the special
+    # characters ('-', 'x') in the species columns into NaN, so no separate
+    # whole-frame replace pass is needed
     data = calculate_totals(data)
-    
+
+    # Sort by Year (stable, so the state/month order within each year is
+    # kept); year-range filters can then binary-search for slice bounds
+    # instead of masking the whole frame
+    data = data.sort_values('Year', kind='stable', ignore_index=True)
+
+    # Narrow any remaining 64-bit columns (e.g. Year)
+    data = downcast_numerics(data)
+
+    return data
+
+
+def melt_species_data(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Melts the wide species columns into a tidy long-format DataFrame.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        A prepared DataFrame with the standardized species columns
+
+    Returns:
+    --------
+    pd.DataFrame
+        A long-format DataFrame with one row per (State, Year, Month,
+        Species, Channel) combination and a single 'Value' column. Species
+        and Channel are categoricals, so groupbys on them aggregate over
+        small integer codes.
+
+    Notes:
+    ------
+    The plot functions consume the precomputed total aggregates and do not
+    need this view; it exists for species-level analyses, where one melt up
+    front turns every subsequent query into a cheap categorical groupby
+    instead of a scan over 72 wide columns.
+    """
+    id_columns = [col for col in ('State', 'Year', 'Month') if col in data.columns]
+    value_columns = [col for col in SPECIES_COLUMNS if col in data.columns]
+
+    long = data.melt(
+        id_vars=id_columns,
+        value_vars=value_columns,
+        var_name='key',
+        value_name='Value'
+    )
+
+    # Split '{Species}_{Channel}' via per-column lookup tables; species names
+    # may themselves contain spaces, so split on the final underscore
+    species_by_column = {col: col.rsplit('_', 1)[0] for col in value_columns}
+    channel_by_column = {col: col.rsplit('_', 1)[1] for col in value_columns}
+    key = long.pop('key')
+    long['Species'] = pd.Categorical(key.map(species_by_column), categories=ANIMAL_SPECIES)
+    long['Channel'] = key.map(channel_by_column).astype('category')
+
+    return long[id_columns + ['Species', 'Channel', 'Value']]
+
+
+def _prepare_with_polars(file_path: str) -> pd.DataFrame:
+    """
+    Loads and prepares the dataset with Polars' multi-threaded lazy engine.
+
+    Produces the same DataFrame as prepare_data(load_data(file_path)) but
+    runs the parse, numeric casts, and totals as one parallel query plan.
+    Raises when polars is missing or too old for the scan arguments
+    (requirements.txt pins polars>=1.0); callers fall back to the pandas
+    pipeline on any failure.
+    """
+    import polars as pl
+
+    # The first 6 lines are metadata and the two header rows; assign the
+    # standardized column names directly instead of parsing the duplicated
+    # species headers
+    columns = ['State', 'Year', 'Month'] + SPECIES_COLUMNS
+
+    lazy = (
+        pl.scan_csv(
+            file_path,
+            separator=';',
+            skip_rows=6,
+            has_header=False,
+            new_columns=columns,
+            null_values=['-', 'x', ''],
+            infer_schema=False
+        )
+        .filter(
+            pl.col('State').is_not_null()
+            & pl.col('Year').is_not_null()
+            & pl.col('Month').is_not_null()
+        )
+        .with_columns(
+            pl.col('Year').cast(pl.Int64),
+            pl.col(SPECIES_COLUMNS).cast(pl.Float64, strict=False)
+        )
+        .with_columns(
+            pl.sum_horizontal(DONR_COLUMNS).alias('Total Domestic(Nr)'),
+            pl.sum_horizontal(FONR_COLUMNS).alias('Total Foreign(Nr)'),
+            pl.sum_horizontal(HONR_COLUMNS).alias('Total Home(Nr)'),
+            pl.sum_horizontal(DOT_COLUMNS).alias('Total Domestic(t)'),
+            pl.sum_horizontal(FOT_COLUMNS).alias('Total Foreign(t)'),
+            pl.sum_horizontal(HOT_COLUMNS).alias('Total Home(t)')
+        )
+    )
+
+    # The last 4 rows are footer metadata; their State is null so the
+    # filter above already removed them
+    data = lazy.collect().to_pandas()
+
+    # Match the pandas pipeline: narrow dtypes, categorical keys, and
+    # repaired umlauts
+    data = _downcast_slaughter_columns(data)
+    data['State'] = data['State'].astype('category')
+    data['State'] = data['State'].cat.rename_categories(
+        lambda state: state.replace('�', 'ü')
+    )
+    data['Month'] = pd.Categorical(data['Month'], categories=MONTHS_ORDER, ordered=True)
+    data = data.sort_values('Year', kind='stable', ignore_index=True)
+    data = downcast_numerics(data)
+
+    return data
+
+
+# Bumped whenever the prepared-frame layout changes, so stale Parquet
+# caches from older pipeline versions are not served
+_CACHE_VERSION = 3
+
+
+def _cache_path(file_path: str) -> str:
+    """Returns the cache file path for a source CSV, keyed by mtime and size."""
+    stat = os.stat(file_path)
+    return os.path.join(
+        CACHE_DIR,
+        f"slaughter_v{_CACHE_VERSION}_{stat.st_mtime_ns}_{stat.st_size}.parquet"
+    )
+
+
+def load_prepared_data(file_path: str) -> pd.DataFrame:
+    """
+    Loads and prepares the dataset, caching the prepared result as Parquet.
+
+    Parameters:
+    -----------
+    file_path : str
+        Path to the CSV file containing the data
+
+    Returns:
+    --------
+    pd.DataFrame
+        The cleaned and transformed dataset, ready for analysis
+
+    Notes:
+    ------
+    The prepared DataFrame is cached under CACHE_DIR in a file keyed by the
+    source file's modification time and size, so re-runs against an unchanged
+    CSV skip the parse and cleanup entirely. Caching is best effort: if no
+    Parquet engine (e.g. pyarrow) is installed, the function silently falls
+    back to the full load-and-prepare path.
+    """
+    cache_file = _cache_path(file_path)
+    if os.path.exists(cache_file):
+        try:
+            return pd.read_parquet(cache_file)
+        except Exception:
+            pass  # Corrupt or unreadable cache; rebuild it below
+
+    try:
+        # Parallel load-and-prepare when polars is installed; any polars
+        # failure (missing, too old for the scan arguments, engine error)
+        # falls back to the pandas pipeline
+        data = _prepare_with_polars(file_path)
+    except Exception:
+        data = prepare_data(load_data(file_path))
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        data.to_parquet(cache_file)
+    except Exception:
+        pass  # No Parquet engine available; caching is optional
+
     return data
@@ -5,6 +5,11 @@ This module provides functions for creating interactive visualizations
 of the German animal slaughter data using Plotly.
 """
 
+import collections
+import functools
+import os
+import weakref
+
 import pandas as pd
 import numpy as np
 import plotly.express as px
@@ -12,6 +17,8 @@ import plotly.graph_objects as go
 from typing import Dict, List, Tuple, Optional, Union
 import geopandas as gpd
 
+from .data_preparation import CACHE_DIR, DONR_COLUMNS
+
 from .config import (
     ANIMAL_SPECIES, 
     PLOT_FIGSIZE, 
@@ -23,15 +30,214 @@ from .config import (
     DEFAULT_TIME_RANGE
 )
 
+# Total columns produced by data_preparation.calculate_totals
+TOTAL_COLUMNS = [
+    'Total Domestic(Nr)', 'Total Foreign(Nr)', 'Total Home(Nr)',
+    'Total Domestic(t)', 'Total Foreign(t)', 'Total Home(t)'
+]
+
+
+# Rendered figures kept per plot function before LRU eviction kicks in
+FIGURE_CACHE_SIZE = 32
+
+
+def _memoize_figure(plot_function):
+    """
+    Caches a plot function's figures keyed by a cheap frame fingerprint.
+
+    The fingerprint is (frame id, length, column names, time_range):
+    identity plus shape is enough for this pipeline, where the frame is
+    immutable after load, and avoids hashing any cell values. A weakref
+    finalizer purges a frame's entries when it is garbage collected, so
+    a new frame reusing the old address cannot hit a stale entry. Calls
+    that pass explicit aggregates bypass the cache entirely, since the
+    same fingerprint could otherwise serve a figure built from
+    different aggregates. Both hits and misses return a copy, so
+    callers can mutate their figure without corrupting the cached one;
+    the least recently used entries are evicted past FIGURE_CACHE_SIZE.
+    """
+    cache = collections.OrderedDict()
+
+    def evict_frame(frame_id):
+        for fingerprint in [key for key in cache if key[0] == frame_id]:
+            del cache[fingerprint]
+
+    @functools.wraps(plot_function)
+    def wrapper(data, time_range=None, interactive=True, aggregates=None):
+        if aggregates is not None:
+            return plot_function(data, time_range, interactive, aggregates)
+        fingerprint = (id(data), len(data), tuple(map(str, data.columns)), time_range)
+        if fingerprint in cache:
+            cache.move_to_end(fingerprint)
+            return go.Figure(cache[fingerprint])
+        figure = plot_function(data, time_range, interactive, aggregates)
+        cache[fingerprint] = figure
+        weakref.finalize(data, evict_frame, id(data))
+        if len(cache) > FIGURE_CACHE_SIZE:
+            cache.popitem(last=False)
+        return go.Figure(figure)
+
+    return wrapper
+
+
+def _filter_time_range(
+    data: pd.DataFrame,
+    time_range: Tuple[int, int]
+) -> pd.DataFrame:
+    """
+    Restricts the frame to the given (start_year, end_year), inclusive.
+
+    Prepared data arrives stable-sorted by Year, so the slice bounds are
+    found with two binary searches and iloc returns the range without a
+    full boolean mask; unsorted frames fall back to masking.
+    """
+    years = data['Year'].to_numpy()
+    if data['Year'].is_monotonic_increasing:
+        start, stop = np.searchsorted(years, [time_range[0], time_range[1] + 1])
+        return data.iloc[start:stop]
+    return data[(years >= time_range[0]) & (years <= time_range[1])]
+
+
+def _shrink_log_values(values: Union[pd.Series, np.ndarray]) -> np.ndarray:
+    """
+    Downcasts y values destined for a log-scale trace to 4-byte types.
+
+    Log axes only need ~3 significant digits on screen, so float32's seven
+    are plenty; the narrower dtype halves the bytes Plotly serializes into
+    the figure JSON. Integers keep an integer dtype where they fit so hover
+    labels stay exact.
+    """
+    arr = np.asarray(values)
+    if np.issubdtype(arr.dtype, np.integer):
+        if arr.size == 0 or np.abs(arr).max() <= np.iinfo(np.int32).max:
+            return arr.astype(np.int32, copy=False)
+        return arr.astype(np.float32, copy=False)
+    return arr.astype(np.float32, copy=False)
+
+
+def aggregate_totals(
+    data: pd.DataFrame,
+    time_range: Optional[Tuple[int, int]] = None
+) -> Dict[str, pd.DataFrame]:
+    """
+    Precomputes the total-column aggregates shared by the plot functions.
+
+    Parameters:
+    -----------
+    data : pd.DataFrame
+        The input DataFrame containing data on slaughtered animals
+    time_range : Tuple[int, int], optional
+        A tuple specifying the range of years to include (start_year, end_year)
+
+    Returns:
+    --------
+    Dict[str, pd.DataFrame]
+        A dictionary with the aggregates used across the plot functions:
+        - 'by_year': totals summed per year
+        - 'by_state_year': totals summed per state and year
+        - 'by_state': totals summed per state
+        - 'by_month': totals averaged per month
+        - 'species_counts': domestic slaughter count summed per species column
+
+    Notes:
+    ------
+    Each plot function computes these aggregates on demand when none are
+    passed in, but computing them once here and sharing the result avoids
+    re-scanning the full dataset for every plot.
+    """
+    columns = [col for col in TOTAL_COLUMNS if col in data.columns]
+    donr_columns = [col for col in DONR_COLUMNS if col in data.columns]
+
+    # Prune to the key, total, and species-count columns before filtering so
+    # the boolean mask only copies the columns the aggregates actually use,
+    # and filter exactly once for all plots
+    keys = [col for col in ('State', 'Year', 'Month') if col in data.columns]
+    data = data[keys + columns + donr_columns]
+
+    # Prepared data already carries State as a categorical, so the groupby
+    # hashes integer codes; factorize plain-string State columns the same
+    # way instead of hashing every row's string (observed=True below keeps
+    # the unobserved categories out of the result)
+    if 'State' in data.columns and not isinstance(data['State'].dtype, pd.CategoricalDtype):
+        data = data.assign(State=pd.Categorical(data['State']))
+
+    if time_range:
+        data = _filter_time_range(data, time_range)
+
+    # Per-species domestic slaughter counts for plot_most_slaughtered_animals;
+    # prepared data is already numeric, so only coerce when needed, and
+    # reduce the stacked block in one contiguous NumPy pass
+    species_block = data[donr_columns]
+    if not all(pd.api.types.is_numeric_dtype(dtype) for dtype in species_block.dtypes):
+        species_block = species_block.apply(pd.to_numeric, errors='coerce')
+    species_counts = pd.Series(
+        np.nansum(species_block.to_numpy(dtype=np.float64, na_value=np.nan), axis=0)
+        .astype(np.int64),
+        index=donr_columns
+    )
+
+    # by_year and by_state are folded from the state-year aggregate so the
+    # full frame is only scanned twice (sums and monthly means). Key order
+    # matters for by_state_year/by_year (line plots draw in row order) and
+    # by_month (calendar order); by_state is re-sorted by volume in its
+    # consumers, so skip sorting it here
+    by_state_year = data.groupby(['State', 'Year'], observed=True)[columns].sum().reset_index()
+    by_year = by_state_year.groupby('Year')[columns].sum().reset_index()
+    by_state = by_state_year.groupby('State', observed=True, sort=False)[columns].sum().reset_index()
+    by_month = data.groupby('Month', observed=True)[columns].mean().reset_index()
+
+    return {
+        'by_year': by_year,
+        'by_state_year': by_state_year,
+        'by_state': by_state,
+        'by_month': by_month,
+        'species_counts': species_counts
+    }
+
+
+@functools.lru_cache(maxsize=1)
+def load_geomap() -> gpd.GeoDataFrame:
+    """
+    Loads the federal state geometries, indexed by state name ('GEN').
+
+    Returns:
+    --------
+    gpd.GeoDataFrame
+        The state geometries from GEOMAP_PATH with 'GEN' as index
+
+    Notes:
+    ------
+    The shapefile is static, so the parsed GeoDataFrame is cached in memory
+    for the session and, best effort, as Feather under CACHE_DIR: later
+    interpreter sessions then skip the much slower shapefile parse.
+    """
+    cache_file = os.path.join(CACHE_DIR, 'vg2500_bld.feather')
+    if os.path.exists(cache_file):
+        try:
+            return gpd.read_feather(cache_file).set_index('GEN')
+        except Exception:
+            pass  # Corrupt or unreadable cache; rebuild it below
 
+    geomap = gpd.read_file(GEOMAP_PATH)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        geomap.to_feather(cache_file)
+    except Exception:
+        pass  # No Feather support available; caching is optional
+
+    return geomap.set_index('GEN')
+
+
+@_memoize_figure
 def plot_total_animals_slaughtered(
-    data: pd.DataFrame, 
+    data: pd.DataFrame,
     time_range: Optional[Tuple[int, int]] = None,
-    interactive: bool = True
+    interactive: bool = True,
+    aggregates: Optional[Dict[str, pd.DataFrame]] = None
 ) -> go.Figure:
     """
     Generates a line plot showing the total number of slaughtered domestic animals over time.
-    
+
     Parameters:
     -----------
     data : pd.DataFrame
@@ -40,20 +246,21 @@ def plot_total_animals_slaughtered(
         A tuple specifying the range of years to include in the plot (start_year, end_year)
     interactive : bool, default=True
         Whether to create an interactive Plotly visualization
-        
+    aggregates : Dict[str, pd.DataFrame], optional
+        Precomputed aggregates from aggregate_totals; computed on demand if omitted
+
     Returns:
     --------
     plotly.graph_objects.Figure
         A Plotly figure object containing the visualization
     """
-    # Filter by time range if specified
-    if time_range:
-        data = data[(data['Year'] >= time_range[0]) & (data['Year'] <= time_range[1])]
-    else:
+    if aggregates is None:
+        aggregates = aggregate_totals(data, time_range)
+    if not time_range:
         time_range = DEFAULT_TIME_RANGE
-    
+
     # Aggregate data by year
-    catalog_aggregated = data.groupby(['Year']).sum().reset_index()
+    catalog_aggregated = aggregates['by_year']
     
     # Create interactive Plotly figure
     fig = go.Figure()
@@ -62,7 +269,7 @@ def plot_total_animals_slaughtered(
     fig.add_trace(
         go.Scatter(
             x=catalog_aggregated['Year'],
-            y=catalog_aggregated['Total Domestic(Nr)'],
+            y=_shrink_log_values(catalog_aggregated['Total Domestic(Nr)']),
             mode='lines',
             name='Total Domestic Animals',
             line=dict(color=PLOT_COLOR, width=2),
@@ -90,14 +297,16 @@ def plot_total_animals_slaughtered(
     return fig
 
 
+@_memoize_figure
 def plot_most_slaughtered_animals(
-    data: pd.DataFrame, 
+    data: pd.DataFrame,
     time_range: Optional[Tuple[int, int]] = None,
-    interactive: bool = True
+    interactive: bool = True,
+    aggregates: Optional[Dict[str, pd.DataFrame]] = None
 ) -> go.Figure:
     """
     Generates a bar plot showing the count of the most slaughtered animal species over time.
-    
+
     Parameters:
     -----------
     data : pd.DataFrame
@@ -106,42 +315,49 @@ def plot_most_slaughtered_animals(
         A tuple specifying the range of years to include in the plot (start_year, end_year)
     interactive : bool, default=True
         Whether to create an interactive Plotly visualization
-        
+    aggregates : Dict[str, pd.DataFrame], optional
+        Precomputed aggregates from aggregate_totals; computed on demand if omitted
+
     Returns:
     --------
     plotly.graph_objects.Figure
         A Plotly figure object containing the visualization
     """
-    # Filter by time range if specified
-    if time_range:
-        data = data[(data['Year'] >= time_range[0]) & (data['Year'] <= time_range[1])]
-    else:
+    if aggregates is None:
+        aggregates = aggregate_totals(data, time_range)
+    if not time_range:
         time_range = DEFAULT_TIME_RANGE
-    
-    # Calculate counts for each species
-    species_counts = []
-    for species in ANIMAL_SPECIES:
-        species_counts.append(data[f"{species}_DoNr"].apply(pd.to_numeric, errors='coerce').sum())
-    
-    # Create DataFrame for plotting
-    plot_data = pd.DataFrame({'Species': ANIMAL_SPECIES, 'Count': species_counts})
-    plot_data = plot_data.sort_values(by='Count', ascending=False)
-    
-    # Create color gradient based on count values
-    max_count = plot_data['Count'].max()
-    normalized_counts = plot_data['Count'] / max_count
-    colors = [f'rgba(0, 128, 0, {0.2 + 0.8 * val})' for val in normalized_counts]
-    
+
+    # Per-species counts from the shared aggregates, indexed by the _DoNr
+    # column names
+    species_counts = aggregates['species_counts']
+
+    # Sort species by count with plain NumPy arrays; a DataFrame wrapper
+    # around twelve values just to sort and unwrap it again is overhead
+    counts = species_counts.to_numpy()
+    order = np.argsort(-counts)
+    counts = counts[order]
+    species = np.array(
+        [column.rsplit('_', 1)[0] for column in species_counts.index]
+    )[order]
+
     # Create interactive Plotly figure
     fig = go.Figure()
-    
-    # Add bars
+
+    # Add bars; the count-proportional green gradient comes from mapping
+    # the numeric counts through a colorscale, so no per-bar rgba strings
+    # are formatted in Python or serialized into the figure
     fig.add_trace(
         go.Bar(
-            x=plot_data['Species'],
-            y=plot_data['Count'],
-            marker_color=colors,
-            text=plot_data['Count'].apply(lambda x: f'{x:,}'),
+            x=species,
+            y=_shrink_log_values(counts),
+            marker=dict(
+                color=counts,
+                colorscale='Greens',
+                cmin=0,
+                cmax=counts[0] if len(counts) else 1
+            ),
+            text=[f'{count:,}' for count in counts.tolist()],
             textposition='auto'
         )
     )
@@ -164,14 +380,16 @@ def plot_most_slaughtered_animals(
     return fig
 
 
+@_memoize_figure
 def plot_animals_by_region(
-    data: pd.DataFrame, 
+    data: pd.DataFrame,
     time_range: Optional[Tuple[int, int]] = None,
-    interactive: bool = True
+    interactive: bool = True,
+    aggregates: Optional[Dict[str, pd.DataFrame]] = None
 ) -> go.Figure:
     """
     Generates a line plot showing the total number of slaughtered domestic animals by region over time.
-    
+
     Parameters:
     -----------
     data : pd.DataFrame
@@ -180,27 +398,41 @@ def plot_animals_by_region(
         A tuple specifying the range of years to include in the plot (start_year, end_year)
     interactive : bool, default=True
         Whether to create an interactive Plotly visualization
-        
+    aggregates : Dict[str, pd.DataFrame], optional
+        Precomputed aggregates from aggregate_totals; computed on demand if omitted
+
     Returns:
     --------
     plotly.graph_objects.Figure
         A Plotly figure object containing the visualization
     """
-    # Filter by time range if specified
-    if time_range:
-        data = data[(data['Year'] >= time_range[0]) & (data['Year'] <= time_range[1])]
-    else:
+    if aggregates is None:
+        aggregates = aggregate_totals(data, time_range)
+    if not time_range:
         time_range = DEFAULT_TIME_RANGE
-    
-    # Aggregate data by state and year
-    data_aggregated = data.groupby(['State', 'Year']).sum().reset_index()
-    
+
+    # Aggregate data by state and year; assign (rather than mutate) the
+    # downcast log-axis column so the shared aggregates stay untouched
+    data_aggregated = aggregates['by_state_year'].assign(
+        **{'Total Domestic(Nr)': _shrink_log_values(
+            aggregates['by_state_year']['Total Domestic(Nr)'])}
+    )
+
+    # Order the state traces by overall volume, taken from the already
+    # computed by-state aggregate instead of re-sorting the state-year frame
+    state_order = (
+        aggregates['by_state']
+        .sort_values(by='Total Domestic(Nr)', ascending=False)['State']
+        .tolist()
+    )
+
     # Create interactive Plotly figure
     fig = px.line(
         data_aggregated,
         x='Year',
         y='Total Domestic(Nr)',
         color='State',
+        category_orders={'State': state_order},
         title=f'Total Slaughtered Animals by Region ({time_range[0]} to {time_range[1]})',
         labels={'Total Domestic(Nr)': 'Animal Count', 'Year': 'Year'},
         log_y=True,
@@ -229,15 +461,17 @@ def plot_animals_by_region(
     return fig
 
 
+@_memoize_figure
 def plot_seasonal_fluctuations(
-    data: pd.DataFrame, 
+    data: pd.DataFrame,
     time_range: Optional[Tuple[int, int]] = None,
-    interactive: bool = True
+    interactive: bool = True,
+    aggregates: Optional[Dict[str, pd.DataFrame]] = None
 ) -> go.Figure:
     """
     Generates a line plot showing the average seasonal fluctuations of slaughtered animals
     over the specified time range.
-    
+
     Parameters:
     -----------
     data : pd.DataFrame
@@ -246,23 +480,30 @@ def plot_seasonal_fluctuations(
         A tuple specifying the range of years to include in the plot (start_year, end_year)
     interactive : bool, default=True
         Whether to create an interactive Plotly visualization
-        
+    aggregates : Dict[str, pd.DataFrame], optional
+        Precomputed aggregates from aggregate_totals; computed on demand if omitted
+
     Returns:
     --------
     plotly.graph_objects.Figure
         A Plotly figure object containing the visualization
     """
-    # Filter by time range if specified
-    if time_range:
-        data = data[(data['Year'] >= time_range[0]) & (data['Year'] <= time_range[1])]
-    else:
+    if aggregates is None:
+        aggregates = aggregate_totals(data, time_range)
+    if not time_range:
         time_range = DEFAULT_TIME_RANGE
-    
-    # Convert Month to categorical for proper ordering
-    data['Month'] = pd.Categorical(data['Month'], categories=MONTHS_ORDER, ordered=True)
-    
-    # Calculate monthly averages
-    monthly_avg = data.groupby('Month')['Total Domestic(Nr)'].mean().reset_index()
+
+    # Monthly averages, realigned to calendar order; the reindex over the
+    # 12-row aggregate also covers plain-string Month columns, which would
+    # otherwise aggregate in alphabetical order
+    monthly_avg = (
+        aggregates['by_month']
+        .set_index('Month')
+        .reindex(MONTHS_ORDER)
+        .dropna(how='all')
+        .rename_axis('Month')
+        .reset_index()
+    )
     
     # Create interactive Plotly figure
     fig = go.Figure()
@@ -313,15 +554,17 @@ def plot_seasonal_fluctuations(
     return fig
 
 
+@_memoize_figure
 def plot_slaughter_distribution(
-    data: pd.DataFrame, 
+    data: pd.DataFrame,
     time_range: Optional[Tuple[int, int]] = None,
-    interactive: bool = True
+    interactive: bool = True,
+    aggregates: Optional[Dict[str, pd.DataFrame]] = None
 ) -> go.Figure:
     """
     Generates a grouped bar plot showing the distribution of domestic slaughter and home slaughter
     by region over the specified time range.
-    
+
     Parameters:
     -----------
     data : pd.DataFrame
@@ -330,30 +573,26 @@ def plot_slaughter_distribution(
         A tuple specifying the range of years to include in the plot (start_year, end_year)
     interactive : bool, default=True
         Whether to create an interactive Plotly visualization
-        
+    aggregates : Dict[str, pd.DataFrame], optional
+        Precomputed aggregates from aggregate_totals; computed on demand if omitted
+
     Returns:
     --------
     plotly.graph_objects.Figure
         A Plotly figure object containing the visualization
     """
-    # Filter by time range if specified
-    if time_range:
-        data = data[(data['Year'] >= time_range[0]) & (data['Year'] <= time_range[1])]
-    else:
+    if aggregates is None:
+        aggregates = aggregate_totals(data, time_range)
+    if not time_range:
         time_range = DEFAULT_TIME_RANGE
-    
-    # Calculate sums by state
-    domestic_slaughter = data.groupby('State')['Total Domestic(Nr)'].sum().reset_index()
-    home_slaughter = data.groupby('State')['Total Home(Nr)'].sum().reset_index()
-    
-    # Sort by domestic slaughter count
-    domestic_slaughter = domestic_slaughter.sort_values(by='Total Domestic(Nr)', ascending=False)
-    states_order = domestic_slaughter['State'].tolist()
-    
-    # Reorder home slaughter data to match domestic slaughter
-    home_slaughter['State'] = pd.Categorical(home_slaughter['State'], categories=states_order, ordered=True)
-    home_slaughter = home_slaughter.sort_values(by='State')
-    
+
+    # Sums by state: both totals come aligned from the same aggregate, so
+    # one sort by domestic count orders both traces and no categorical
+    # realignment is needed
+    by_state = aggregates['by_state'].sort_values(by='Total Domestic(Nr)', ascending=False)
+    domestic_slaughter = by_state[['State', 'Total Domestic(Nr)']]
+    home_slaughter = by_state[['State', 'Total Home(Nr)']]
+
     # Create interactive Plotly figure
     fig = go.Figure()
     
@@ -361,10 +600,10 @@ def plot_slaughter_distribution(
     fig.add_trace(
         go.Bar(
             x=domestic_slaughter['State'],
-            y=domestic_slaughter['Total Domestic(Nr)'],
+            y=_shrink_log_values(domestic_slaughter['Total Domestic(Nr)']),
             name='Domestic Slaughter',
             marker_color='green',
-            text=domestic_slaughter['Total Domestic(Nr)'].apply(lambda x: f'{x:,}'),
+            text=[f'{count:,}' for count in domestic_slaughter['Total Domestic(Nr)'].tolist()],
             textposition='auto'
         )
     )
@@ -373,10 +612,10 @@ def plot_slaughter_distribution(
     fig.add_trace(
         go.Bar(
             x=home_slaughter['State'],
-            y=home_slaughter['Total Home(Nr)'],
+            y=_shrink_log_values(home_slaughter['Total Home(Nr)']),
             name='Home Slaughter',
             marker_color='lightgreen',
-            text=home_slaughter['Total Home(Nr)'].apply(lambda x: f'{x:,}'),
+            text=[f'{count:,}' for count in home_slaughter['Total Home(Nr)'].tolist()],
             textposition='auto'
         )
     )
@@ -0,0 +1,53 @@
+"""
+Tests for the data preparation module.
+"""
+
+import pytest
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.modules.data_preparation import downcast_numerics, melt_species_data
+from src.modules.config import ANIMAL_SPECIES
+
+
+@pytest.fixture
+def prepared_dataframe():
+    """Create a small prepared-style DataFrame for testing."""
+    return pd.DataFrame({
+        'State': ['Bayern', 'Berlin'],
+        'Year': [2000, 2001],
+        'Month': ['January', 'February'],
+        'Pigs_DoNr': [100, 200],
+        'Pigs_DoT': [10.0, 20.0],
+        'Cattle_DoNr': [30, 40],
+    })
+
+
+def test_melt_species_data_shape(prepared_dataframe):
+    """Test that melting produces one row per (row, species column) pair."""
+    long = melt_species_data(prepared_dataframe)
+    assert long.shape == (6, 6)  # 2 rows x 3 species columns
+    assert list(long.columns) == ['State', 'Year', 'Month', 'Species', 'Channel', 'Value']
+
+
+def test_downcast_numerics(prepared_dataframe):
+    """Test that 64-bit columns are narrowed without changing values."""
+    data = downcast_numerics(prepared_dataframe.copy())
+    assert data['Year'].dtype == np.int16
+    assert data['Pigs_DoT'].dtype == np.float32
+    assert data['Year'].tolist() == [2000, 2001]
+    assert data['Pigs_DoNr'].tolist() == [100, 200]
+
+
+def test_melt_species_data_values(prepared_dataframe):
+    """Test that species, channel, and value are split correctly."""
+    long = melt_species_data(prepared_dataframe)
+    pigs_count = long[(long['Species'] == 'Pigs') & (long['Channel'] == 'DoNr')]
+    assert pigs_count['Value'].tolist() == [100, 200]
+    assert str(long['Species'].dtype) == 'category'
+    assert str(long['Channel'].dtype) == 'category'
@@ -15,6 +15,7 @@ from src.modules.data_validation import (
     validate_columns,
     validate_animal_species_columns,
     validate_dataframe,
+    validate_dataframe_parallel,
     get_data_summary
 )
 from src.modules.config import ANIMAL_SPECIES
@@ -92,6 +93,38 @@ def test_validate_dataframe_invalid(invalid_dataframe):
     assert len(results['errors']) >= 2  # At least 2 errors (missing columns and species)
 
 
+def test_validate_dataframe_parallel_matches_serial(sample_dataframe):
+    """Test that the parallel validator agrees with validate_dataframe."""
+    import src.modules.data_validation as data_validation
+
+    serial = validate_dataframe(sample_dataframe)
+    # Small frames take the serial fallback
+    assert validate_dataframe_parallel(sample_dataframe) == serial
+    # Lower the threshold to force the sharded path
+    original_min_rows = data_validation.PARALLEL_MIN_ROWS
+    data_validation.PARALLEL_MIN_ROWS = 0
+    try:
+        parallel = validate_dataframe_parallel(sample_dataframe, n_workers=2)
+    finally:
+        data_validation.PARALLEL_MIN_ROWS = original_min_rows
+    assert parallel == serial
+
+
+def test_validate_dataframe_parallel_finds_cross_shard_duplicates(sample_dataframe):
+    """Test that duplicates split across shards are still detected."""
+    import src.modules.data_validation as data_validation
+
+    # Row 0 and row 3 are identical and land in different shards
+    data = pd.concat([sample_dataframe, sample_dataframe.iloc[[0]]], ignore_index=True)
+    original_min_rows = data_validation.PARALLEL_MIN_ROWS
+    data_validation.PARALLEL_MIN_ROWS = 0
+    try:
+        results = validate_dataframe_parallel(data, n_workers=2)
+    finally:
+        data_validation.PARALLEL_MIN_ROWS = original_min_rows
+    assert any('duplicate' in error for error in results['errors'])
+
+
 def test_get_data_summary(sample_dataframe):
     """Test get_data_summary."""
     summary = get_data_summary(sample_dataframe)
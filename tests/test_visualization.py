@@ -8,6 +8,7 @@ import unittest
 import pandas as pd
 import numpy as np
 from src.modules.visualization import (
+    aggregate_totals,
     plot_total_animals_slaughtered,
     plot_most_slaughtered_animals,
     plot_animals_by_region,
@@ -68,6 +69,34 @@ class TestVisualization(unittest.TestCase):
         # Check that the figure has data
         self.assertTrue(len(fig.data) > 0)
 
+    def test_aggregate_totals_only_observed_categories(self):
+        """Test that aggregates contain no rows for unobserved categories."""
+        data = self.test_data.copy()
+        data['Total Domestic(Nr)'] = data['Pigs_DoNr'] + data['Cattle_DoNr']
+        # Categorical keys with categories that never occur in the data
+        data['State'] = pd.Categorical(data['State'], categories=['State1', 'State2', 'State3'])
+        data['Month'] = pd.Categorical(data['Month'], categories=['January', 'February', 'March'])
+        aggregates = aggregate_totals(data, self.time_range)
+        self.assertNotIn('State3', aggregates['by_state']['State'].tolist())
+        self.assertNotIn('March', aggregates['by_month']['Month'].tolist())
+
+    def test_precomputed_aggregates_match_on_demand(self):
+        """Test that passing precomputed aggregates gives the same figure."""
+        data = self.test_data.copy()
+        data['Total Domestic(Nr)'] = data['Pigs_DoNr'] + data['Cattle_DoNr']
+        data['Total Home(Nr)'] = data['Pigs_HoNr'] + data['Cattle_HoNr']
+        aggregates = aggregate_totals(data, self.time_range)
+        for plot_function in (plot_total_animals_slaughtered,
+                              plot_most_slaughtered_animals,
+                              plot_seasonal_fluctuations,
+                              plot_slaughter_distribution):
+            on_demand = plot_function(data, self.time_range)
+            precomputed = plot_function(data, self.time_range, aggregates=aggregates)
+            # Guard against the figure cache collapsing both calls into
+            # one object, which would make the comparison vacuous
+            self.assertIsNot(on_demand, precomputed)
+            self.assertEqual(on_demand.data[0].y.tolist(), precomputed.data[0].y.tolist())
+
     def test_plot_slaughter_distribution_returns_figure(self):
         """Test if plot_slaughter_distribution returns a plotly figure."""
         fig = plot_slaughter_distribution(self.test_data, self.time_range)